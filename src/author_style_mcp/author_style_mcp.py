@@ -14,9 +14,14 @@ FastMCP Cloud deployment:
 """
 
 import json
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Optional
 
-from fastmcp import FastMCP
+try:
+    import orjson
+except ImportError:  # optional accelerator — fall back to stdlib json
+    orjson = None
 
 from author_style_taxonomy import (
     AUTHOR_CATALOG,
@@ -34,15 +39,74 @@ from author_style_operations import (
     list_authors,
 )
 
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
 
-mcp = FastMCP("author-style-esque")
+
+def _json_default(obj):
+    """Encode the taxonomy's frozen read-only mappings as plain objects."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj, indent: bool = True) -> str:
+    """Encode a tool result as JSON with the stdlib encoder.
+
+    Used directly for results built from caller-supplied JSON, which may
+    carry NaN / Infinity: orjson would silently write those as null.
+    """
+    return json.dumps(obj, indent=2 if indent else None, default=_json_default)
+
+
+def _dumps(obj, indent: bool = True) -> str:
+    """Encode a tool result as JSON, using orjson when it is installed.
+
+    Falls back to the stdlib encoder for anything orjson rejects (e.g.
+    integers beyond 64 bits), so the output never depends on the extra.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        try:
+            return orjson.dumps(obj, default=_json_default, option=option).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return _json_dumps(obj, indent)
+
+
+# Layer 1 payloads are built from import-time constants, so encode them once.
+_AUTHORS_JSON = _dumps(list_authors())
+_DIMENSIONS_JSON = _dumps(DIMENSIONS)
+_PARAM_NAMES_JSON = _dumps(PARAMETER_NAMES, indent=False)
+
+
+@lru_cache(maxsize=len(AUTHOR_CATALOG))
+def _author_profile_json(author_id: str) -> str:
+    """Encoded author profile; unknown IDs raise and are not cached."""
+    return _dumps(get_author_profile(author_id))
+
+
+# Single-author prompts and the max-contrast pair are fully determined by
+# the catalog, so their nested payloads are encoded at most once.
+_MAX_CONTRAST_JSON = _dumps(find_max_contrast_pair())
+
+
+@lru_cache(maxsize=len(AUTHOR_CATALOG))
+def _text_prompt_json(author_id: str) -> str:
+    """Encoded single-author text prompt."""
+    return _dumps(generate_text_prompt(author_id=author_id))
+
+
+@lru_cache(maxsize=len(AUTHOR_CATALOG))
+def _image_prompt_json(author_id: str) -> str:
+    """Encoded single-author image prompt without a style modifier."""
+    return _dumps(generate_image_prompt(author_id=author_id))
 
 
 # -----------------------------------------------------------------------
 # Layer 1 tools — pure taxonomy lookup (0 tokens)
 # -----------------------------------------------------------------------
 
-@mcp.tool()
 def get_author_styles() -> str:
     """List all 11 curated author style bricks with coordinates.
 
@@ -52,10 +116,9 @@ def get_author_styles() -> str:
         JSON mapping author IDs to display names, language origins,
         and 8D style-space coordinates.
     """
-    return json.dumps(list_authors(), indent=2)
+    return _AUTHORS_JSON
 
 
-@mcp.tool()
 def get_author_style_profile(author_id: str) -> str:
     """Get complete profile for an author style brick.
 
@@ -70,10 +133,9 @@ def get_author_style_profile(author_id: str) -> str:
         Complete profile including coordinates, signature moves,
         text vocabulary, and image vocabulary.
     """
-    return json.dumps(get_author_profile(author_id), indent=2)
+    return _author_profile_json(author_id)
 
 
-@mcp.tool()
 def get_style_dimensions() -> str:
     """List all 8 style-space dimensions with descriptions and output mappings.
 
@@ -83,10 +145,9 @@ def get_style_dimensions() -> str:
         JSON with dimension specs including text and image output mappings
         at low/mid/high tiers.
     """
-    return json.dumps(DIMENSIONS, indent=2)
+    return _DIMENSIONS_JSON
 
 
-@mcp.tool()
 def get_parameter_names() -> str:
     """Return ordered list of parameter names for dynamics integration.
 
@@ -95,14 +156,13 @@ def get_parameter_names() -> str:
     Use this to get parameter names compatible with aesthetics-dynamics-core
     tools (integrate_trajectory, compute_gradient_field, etc.)
     """
-    return json.dumps(PARAMETER_NAMES)
+    return _PARAM_NAMES_JSON
 
 
 # -----------------------------------------------------------------------
 # Layer 2 tools — deterministic operations (0 tokens)
 # -----------------------------------------------------------------------
 
-@mcp.tool()
 def compute_author_distance(
     author_id_1: str,
     author_id_2: str,
@@ -120,13 +180,9 @@ def compute_author_distance(
     Returns:
         Distance with per-dimension breakdown and max-contrast axis.
     """
-    return json.dumps(
-        compute_style_distance(author_id_1, author_id_2, weighted),
-        indent=2,
-    )
+    return _dumps(compute_style_distance(author_id_1, author_id_2, weighted))
 
 
-@mcp.tool()
 def blend_author_styles(blend_spec_json: str) -> str:
     """Blend multiple author styles by weighted interpolation.
 
@@ -145,10 +201,9 @@ def blend_author_styles(blend_spec_json: str) -> str:
         and text/image vocabulary for the blend point.
     """
     blend_spec = json.loads(blend_spec_json)
-    return json.dumps(interpolate_styles(blend_spec), indent=2)
+    return _json_dumps(interpolate_styles(blend_spec))
 
 
-@mcp.tool()
 def generate_text_style_prompt(
     author_id: str = "",
     blend_spec_json: str = "",
@@ -169,18 +224,18 @@ def generate_text_style_prompt(
         Structured directives including master directive string,
         signature moves, vocabulary constraints, and full composited prompt.
     """
-    kwargs = {}
     if author_id:
-        kwargs["author_id"] = author_id
-    elif blend_spec_json:
+        return _text_prompt_json(author_id)
+
+    kwargs = {}
+    if blend_spec_json:
         kwargs["blend_spec"] = json.loads(blend_spec_json)
     elif custom_coordinates_json:
         kwargs["custom_coordinates"] = json.loads(custom_coordinates_json)
 
-    return json.dumps(generate_text_prompt(**kwargs), indent=2)
+    return _json_dumps(generate_text_prompt(**kwargs))
 
 
-@mcp.tool()
 def generate_image_style_prompt(
     author_id: str = "",
     blend_spec_json: str = "",
@@ -206,18 +261,20 @@ def generate_image_style_prompt(
         Keywords, color palette, compositional rules, per-dimension visuals,
         and composited prompt string.
     """
+    if author_id and not style_modifier:
+        return _image_prompt_json(author_id)
+
     kwargs = {"style_modifier": style_modifier}
     if author_id:
-        kwargs["author_id"] = author_id
+        return _dumps(generate_image_prompt(author_id=author_id, **kwargs))
     elif blend_spec_json:
         kwargs["blend_spec"] = json.loads(blend_spec_json)
     elif custom_coordinates_json:
         kwargs["custom_coordinates"] = json.loads(custom_coordinates_json)
 
-    return json.dumps(generate_image_prompt(**kwargs), indent=2)
+    return _json_dumps(generate_image_prompt(**kwargs))
 
 
-@mcp.tool()
 def find_style_extremes() -> str:
     """Find the maximum-contrast author pair in style-space.
 
@@ -227,10 +284,9 @@ def find_style_extremes() -> str:
         The two authors with greatest Euclidean distance,
         with full per-dimension breakdown.
     """
-    return json.dumps(find_max_contrast_pair(), indent=2)
+    return _MAX_CONTRAST_JSON
 
 
-@mcp.tool()
 def find_nearest_style(author_id: str) -> str:
     """Find the closest author style to a given author.
 
@@ -242,58 +298,102 @@ def find_nearest_style(author_id: str) -> str:
     Returns:
         Nearest author with distance and per-dimension breakdown.
     """
-    return json.dumps(find_nearest_neighbor(author_id), indent=2)
+    return _dumps(find_nearest_neighbor(author_id))
 
 
 # -----------------------------------------------------------------------
 # Server info
 # -----------------------------------------------------------------------
 
-@mcp.tool()
+_SERVER_INFO_JSON = _dumps({
+    "name": "Author Style '-esque' MCP Server",
+    "version": "0.1.0",
+    "description": (
+        "Curated catalog of 11 author writing styles decomposed into "
+        "8 orthogonal dimensions with dual text/image output paths. "
+        "Each style is an independent 'stompbox' that colors prompts "
+        "with structural writing patterns — not copied text."
+    ),
+    "architecture": {
+        "layer_1": "Taxonomy lookup — author coordinates, dimensions (0 tokens)",
+        "layer_2": "Deterministic ops — distance, blend, prompt gen (0 tokens)",
+        "layer_3": "Creative synthesis — consumer LLM responsibility",
+    },
+    "dimensions": len(PARAMETER_NAMES),
+    "parameter_names": PARAMETER_NAMES,
+    "authors": {
+        aid: {
+            "display_name": entry["display_name"],
+            "language_origin": entry["language_origin"],
+        }
+        for aid, entry in AUTHOR_CATALOG.items()
+    },
+    "n_authors": len(AUTHOR_CATALOG),
+    "capabilities": [
+        "Single author style extraction (text + image)",
+        "Multi-author weighted blending",
+        "Style distance computation",
+        "Nearest neighbor / max contrast discovery",
+        "Compatible with aesthetics-dynamics-core for trajectory integration",
+        "Compatible with catastrophe-morph and surface-design-aesthetics for composition",
+    ],
+    "dynamics_integration": (
+        "Use get_parameter_names() to get ordered parameter list, then "
+        "pass author coordinates to aesthetics-dynamics-core tools like "
+        "integrate_trajectory, compute_gradient_field, or "
+        "identify_attractor_basins for style-space dynamics analysis."
+    ),
+})
+
+
 def get_server_info() -> str:
     """Get information about the Author Style MCP server.
 
     Returns server metadata, available authors, dimensions, and capabilities.
     """
-    return json.dumps({
-        "name": "Author Style '-esque' MCP Server",
-        "version": "0.1.0",
-        "description": (
-            "Curated catalog of 11 author writing styles decomposed into "
-            "8 orthogonal dimensions with dual text/image output paths. "
-            "Each style is an independent 'stompbox' that colors prompts "
-            "with structural writing patterns — not copied text."
-        ),
-        "architecture": {
-            "layer_1": "Taxonomy lookup — author coordinates, dimensions (0 tokens)",
-            "layer_2": "Deterministic ops — distance, blend, prompt gen (0 tokens)",
-            "layer_3": "Creative synthesis — consumer LLM responsibility",
-        },
-        "dimensions": len(PARAMETER_NAMES),
-        "parameter_names": PARAMETER_NAMES,
-        "authors": {
-            aid: {
-                "display_name": entry["display_name"],
-                "language_origin": entry["language_origin"],
-            }
-            for aid, entry in AUTHOR_CATALOG.items()
-        },
-        "n_authors": len(AUTHOR_CATALOG),
-        "capabilities": [
-            "Single author style extraction (text + image)",
-            "Multi-author weighted blending",
-            "Style distance computation",
-            "Nearest neighbor / max contrast discovery",
-            "Compatible with aesthetics-dynamics-core for trajectory integration",
-            "Compatible with catastrophe-morph and surface-design-aesthetics for composition",
-        ],
-        "dynamics_integration": (
-            "Use get_parameter_names() to get ordered parameter list, then "
-            "pass author coordinates to aesthetics-dynamics-core tools like "
-            "integrate_trajectory, compute_gradient_field, or "
-            "identify_attractor_basins for style-space dynamics analysis."
-        ),
-    }, indent=2)
+    return _SERVER_INFO_JSON
+
+
+# -----------------------------------------------------------------------
+# Server assembly
+# -----------------------------------------------------------------------
+
+_TOOLS = (
+    get_author_styles,
+    get_author_style_profile,
+    get_style_dimensions,
+    get_parameter_names,
+    compute_author_distance,
+    blend_author_styles,
+    generate_text_style_prompt,
+    generate_image_style_prompt,
+    find_style_extremes,
+    find_nearest_style,
+    get_server_info,
+)
+
+
+def build_server() -> "FastMCP":
+    """Create the FastMCP server and register every tool.
+
+    fastmcp is imported here rather than at module load, so importing this
+    module (e.g. to call the tool functions directly) skips its cold-start
+    cost until a server is actually needed.
+    """
+    from fastmcp import FastMCP
+
+    server = FastMCP("author-style-esque")
+    for tool in _TOOLS:
+        server.tool()(tool)
+    return server
+
+
+def __getattr__(name: str):
+    """Build `mcp` on first access (PEP 562) for `author_style_mcp.py:mcp`."""
+    if name == "mcp":
+        server = globals()["mcp"] = build_server()
+        return server
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # -----------------------------------------------------------------------
@@ -301,4 +401,4 @@ def get_server_info() -> str:
 # -----------------------------------------------------------------------
 
 if __name__ == "__main__":
-    mcp.run()
+    build_server().run()
@@ -7,19 +7,82 @@ prompt generation from author style coordinates.
 All operations are pure computation — no LLM calls.
 """
 
-import json
 import math
+import re
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from itertools import chain, islice
 from typing import Optional
 
 from author_style_taxonomy import (
     AUTHOR_CATALOG,
+    AUTHOR_COORDS,
+    AUTHOR_DIST2,
+    AUTHOR_IDS,
+    AUTHOR_INDEX,
     DIMENSIONS,
     PARAMETER_NAMES,
+    TEXT_VOCABULARY_COLUMNS,
+    TIERS,
     AuthorCoordinates,
+    _unknown_author,
+    coordinates_from_row,
+    get_author,
     get_coordinates,
+    squared_distances,
+    tier_index,
 )
 
 
+# ---------------------------------------------------------------------------
+# Precomputed coordinate table
+# ---------------------------------------------------------------------------
+
+# Perceptual weights — some dimensions contribute more to
+# perceived style difference. These are tunable.
+PERCEPTUAL_WEIGHTS: dict[str, float] = {
+    "syntactic_density":    1.2,
+    "sensory_concreteness": 1.0,
+    "ornamental_register":  1.1,
+    "tension_visibility":   0.9,
+    "tension_temporality":  0.8,
+    "reality_stability":    1.0,
+    "interiority":          1.0,
+    "temporal_mode":        0.8,
+}
+
+# Distance and blend ops index the taxonomy's coordinate rows instead of
+# re-walking the per-author coordinate dicts on every call.
+_W: tuple[float, ...] = tuple(PERCEPTUAL_WEIGHTS[p] for p in PARAMETER_NAMES)
+_ONES: tuple[float, ...] = (1.0,) * len(PARAMETER_NAMES)
+
+
+def _row_index(author_id: str) -> int:
+    """Row of an author in AUTHOR_COORDS; raises ValueError for unknown IDs."""
+    idx = AUTHOR_INDEX.get(author_id)
+    if idx is None:
+        _unknown_author(author_id)
+    return idx
+
+
+def _nearest_row(query: tuple[float, ...]) -> tuple[int, float]:
+    """
+    Row index of, and distance to, the catalog row nearest `query`.
+
+    sqrt is monotonic, so ranking stays on squared distances and only the
+    winner's is taken. Rows a few ulps from the minimum can share its sqrt;
+    the first of those in catalog order wins, as when ranking distances.
+    """
+    dist2 = squared_distances(query)
+    best = min(dist2)
+    dist = math.sqrt(best)
+    near = best * (1.0 + 2.0 ** -50)
+    nearest = next(
+        i for i, d in enumerate(dist2) if d <= near and math.sqrt(d) == dist
+    )
+    return nearest, dist
+
+
 # ---------------------------------------------------------------------------
 # Distance computation
 # ---------------------------------------------------------------------------
@@ -40,42 +103,26 @@ def compute_style_distance(
     Returns:
         dict with total distance, per-dimension breakdown, and max-contrast axis
     """
-    c1 = get_coordinates(author_id_1)
-    c2 = get_coordinates(author_id_2)
-
-    # Perceptual weights — some dimensions contribute more to
-    # perceived style difference. These are tunable.
-    PERCEPTUAL_WEIGHTS = {
-        "syntactic_density":    1.2,
-        "sensory_concreteness": 1.0,
-        "ornamental_register":  1.1,
-        "tension_visibility":   0.9,
-        "tension_temporality":  0.8,
-        "reality_stability":    1.0,
-        "interiority":          1.0,
-        "temporal_mode":        0.8,
-    }
-
-    per_dim = {}
-    sum_sq = 0.0
-
-    for p in PARAMETER_NAMES:
-        diff = c2[p] - c1[p]
-        w = PERCEPTUAL_WEIGHTS[p] if weighted else 1.0
-        weighted_diff = diff * w
-        per_dim[p] = {
-            "value_1": c1[p],
-            "value_2": c2[p],
-            "raw_difference": round(diff, 3),
-            "weighted_difference": round(weighted_diff, 3),
-            "absolute_gap": round(abs(diff), 3),
+    row_1, row_2, diffs, weighted_diffs, gaps, total = _distance_impl(
+        author_id_1, author_id_2, bool(weighted)
+    )
+
+    # Find max-contrast axis (first dimension wins ties)
+    max_gap = max(gaps)
+    max_axis = PARAMETER_NAMES[gaps.index(max_gap)]
+
+    per_dim = {
+        p: {
+            "value_1": v1,
+            "value_2": v2,
+            "raw_difference": round(d, 3),
+            "weighted_difference": round(wd, 3),
+            "absolute_gap": gap,
         }
-        sum_sq += weighted_diff ** 2
-
-    total = math.sqrt(sum_sq)
-
-    # Find max-contrast axis
-    max_axis = max(per_dim, key=lambda k: per_dim[k]["absolute_gap"])
+        for p, v1, v2, d, wd, gap in zip(
+            PARAMETER_NAMES, row_1, row_2, diffs, weighted_diffs, gaps
+        )
+    }
 
     return {
         "author_1": AUTHOR_CATALOG[author_id_1]["display_name"],
@@ -83,15 +130,95 @@ def compute_style_distance(
         "euclidean_distance": round(total, 4),
         "normalized_distance": round(total / math.sqrt(len(PARAMETER_NAMES)), 4),
         "max_contrast_axis": max_axis,
-        "max_contrast_gap": per_dim[max_axis]["absolute_gap"],
+        "max_contrast_gap": max_gap,
         "per_dimension": per_dim,
     }
 
 
+# Ordered pairs (including self-pairs) x weighted/unweighted covers the catalog.
+@lru_cache(maxsize=2 * len(AUTHOR_CATALOG) ** 2)
+def _distance_impl(
+    author_id_1: str,
+    author_id_2: str,
+    weighted: bool,
+) -> tuple[tuple[float, ...], tuple[float, ...], tuple[float, ...],
+           tuple[float, ...], tuple[float, ...], float]:
+    """
+    Memoized numeric core of compute_style_distance.
+
+    Returns immutable per-dimension columns (row_1, row_2, diffs,
+    weighted_diffs, gaps) and the total distance; the caller builds a
+    fresh payload from them on every call.
+    """
+    row_1 = AUTHOR_COORDS[_row_index(author_id_1)]
+    row_2 = AUTHOR_COORDS[_row_index(author_id_2)]
+
+    weights = _W if weighted else _ONES
+
+    diffs = tuple(v2 - v1 for v1, v2 in zip(row_1, row_2))
+    weighted_diffs = tuple(d * w for d, w in zip(diffs, weights))
+    gaps = tuple(round(abs(d), 3) for d in diffs)
+
+    total = math.sqrt(sum(wd * wd for wd in weighted_diffs))
+
+    return row_1, row_2, diffs, weighted_diffs, gaps, total
+
+
 # ---------------------------------------------------------------------------
 # Interpolation (blending)
 # ---------------------------------------------------------------------------
 
+def _blend_coords(
+    blend_spec: dict[str, float],
+) -> tuple[dict[str, float], list[tuple[str, float]], dict[str, float]]:
+    """
+    Normalize a blend spec and compute the blended coordinates.
+
+    Returns (normalized weights, contributors by descending weight,
+    blended coordinates). Shared by interpolate_styles and the prompt
+    generators, which need only part of the full blend result.
+    """
+    if not blend_spec:
+        raise ValueError("blend_spec must contain at least one author")
+
+    # Normalize weights
+    total_weight = sum(blend_spec.values())
+    if total_weight <= 0:
+        raise ValueError("Weights must sum to a positive value")
+
+    normalized = {k: v / total_weight for k, v in blend_spec.items()}
+
+    # Compute blended coordinates — one weighted sum per coordinate column
+    rows = [AUTHOR_COORDS[_row_index(aid)] for aid in normalized]
+    weights = list(normalized.values())
+    blended = coordinates_from_row(
+        round(sum(v * w for v, w in zip(column, weights)), 4)
+        for column in zip(*rows)
+    )
+
+    # Contributors by descending weight — shared by moves and display
+    ordered = sorted(normalized.items(), key=lambda x: -x[1])
+
+    return normalized, ordered, blended
+
+
+def _blend_display(ordered: Sequence[tuple[str, float]]) -> str:
+    """Human-readable blend label, heaviest contributor first."""
+    return " / ".join(
+        f"{round(w * 100)}% {AUTHOR_CATALOG[aid]['display_name']}"
+        for aid, w in ordered
+    )
+
+
+def _blend_moves(ordered: Sequence[tuple[str, float]]) -> list[str]:
+    """Signature moves from contributing authors, in proportion to weight."""
+    return list(chain.from_iterable(
+        islice(AUTHOR_CATALOG[author_id]["signature_moves"],
+               max(1, round(weight * 5)))
+        for author_id, weight in ordered
+    ))
+
+
 def interpolate_styles(
     blend_spec: dict[str, float],
 ) -> dict:
@@ -108,134 +235,208 @@ def interpolate_styles(
     Example:
         interpolate_styles({"hemingway": 0.7, "borges": 0.3})
     """
-    if not blend_spec:
-        raise ValueError("blend_spec must contain at least one author")
-
-    # Normalize weights
-    total_weight = sum(blend_spec.values())
-    if total_weight <= 0:
-        raise ValueError("Weights must sum to a positive value")
-
-    normalized = {k: v / total_weight for k, v in blend_spec.items()}
-
-    # Compute blended coordinates
-    blended: dict[str, float] = {}
-    for p in PARAMETER_NAMES:
-        val = 0.0
-        for author_id, weight in normalized.items():
-            coords = get_coordinates(author_id)
-            val += coords[p] * weight
-        blended[p] = round(val, 4)
-
-    # Find nearest catalog author to blended point
-    min_dist = float("inf")
-    nearest = None
-    for aid in AUTHOR_CATALOG:
-        coords = get_coordinates(aid)
-        dist = math.sqrt(sum(
-            (blended[p] - coords[p]) ** 2 for p in PARAMETER_NAMES
-        ))
-        if dist < min_dist:
-            min_dist = dist
-            nearest = aid
-
-    # Extract output vocabularies for blended state
-    text_output = _extract_text_vocabulary(blended)
-    image_output = _extract_image_vocabulary(blended)
-
-    # Blend signature moves from contributing authors
-    blended_moves = []
-    for author_id, weight in sorted(normalized.items(),
-                                     key=lambda x: -x[1]):
-        entry = AUTHOR_CATALOG[author_id]
-        n_moves = max(1, round(weight * 5))
-        blended_moves.extend(entry["signature_moves"][:n_moves])
+    normalized, ordered, blended_row, nearest_i, min_dist = _interpolate_impl(
+        tuple(blend_spec.items())
+    )
+    blended = coordinates_from_row(blended_row)
+    nearest = AUTHOR_IDS[nearest_i]
 
     return {
         "blend_spec": {
-            aid: round(w, 3) for aid, w in normalized.items()
+            aid: round(w, 3) for aid, w in normalized
         },
-        "blend_display": " / ".join(
-            f"{round(w * 100)}% {AUTHOR_CATALOG[aid]['display_name']}"
-            for aid, w in sorted(normalized.items(), key=lambda x: -x[1])
-        ),
+        "blend_display": _blend_display(ordered),
         "coordinates": blended,
         "nearest_catalog_author": {
             "id": nearest,
             "display_name": AUTHOR_CATALOG[nearest]["display_name"],
             "distance": round(min_dist, 4),
         },
-        "signature_moves": blended_moves,
-        "text_vocabulary": text_output,
-        "image_vocabulary": image_output,
+        "signature_moves": _blend_moves(ordered),
+        "text_vocabulary": _extract_text_vocabulary(blended),
+        "image_vocabulary": _extract_image_vocabulary(blended),
     }
 
 
+@lru_cache(maxsize=128)
+def _interpolate_impl(
+    blend_items: tuple[tuple[str, float], ...],
+) -> tuple[tuple[tuple[str, float], ...], tuple[tuple[str, float], ...],
+           tuple[float, ...], int, float]:
+    """
+    Memoized numeric core of interpolate_styles, keyed on hashable spec items.
+
+    Returns immutable (normalized items, contributors by descending weight,
+    blended row, nearest row index, distance to it); the caller builds a
+    fresh payload from them on every call.
+    """
+    normalized, ordered, blended = _blend_coords(dict(blend_items))
+    blended_row = tuple(blended.values())
+
+    # Find nearest catalog author to blended point
+    nearest_i, min_dist = _nearest_row(blended_row)
+
+    return (
+        tuple(normalized.items()), tuple(ordered), blended_row,
+        nearest_i, min_dist,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Vocabulary extraction
 # ---------------------------------------------------------------------------
 
-def _get_tier(value: float) -> str:
-    """Map a 0-1 value to low/mid/high tier."""
-    if value < 0.33:
-        return "low"
-    elif value < 0.67:
-        return "mid"
-    else:
-        return "high"
+_TIER_LO = (0.0, 0.33, 0.67)
+_TIER_WIDTH = (0.33, 0.34, 0.33)
+
+
+@lru_cache(maxsize=None)
+def _tier_tables(output_type: str) -> tuple[dict, dict]:
+    """
+    Build the per-(dimension, tier) tables for one output type.
+
+    Returns (templates, directives). Templates are the tier vocabularies
+    augmented with the fields that depend only on (dimension, tier);
+    "_value" is a placeholder so per-call copies keep the original key
+    order when it is filled in. Directives are the *_directive strings of
+    each tier vocabulary, in key order, so prompt composition is one lookup
+    per dimension instead of a scan of its keys.
+
+    Built on first use, so a text-only deployment never assembles the
+    image tables.
+    """
+    templates = {}
+    directives = {}
+    for dim_id, spec in DIMENSIONS.items():
+        for tier in TIERS:
+            vocab = spec[output_type][tier]
+            templates[(dim_id, tier)] = {
+                **vocab,
+                "_dimension": dim_id,
+                "_value": None,
+                "_tier": tier,
+            }
+            directives[(dim_id, tier)] = tuple(
+                v for k, v in vocab.items()
+                if k.endswith("_directive") and isinstance(v, str)
+            )
+    return templates, directives
 
 
 def _interpolate_tier_vocabularies(
     dim_id: str,
     value: float,
     output_type: str,  # "text_output_mapping" or "image_output_mapping"
+    tier_idx: Optional[int] = None,
 ) -> dict:
     """
     For values near tier boundaries, blend adjacent tier vocabularies.
     Returns the primary tier's vocabulary with boundary proximity info.
     """
-    dim = DIMENSIONS[dim_id]
-    tier = _get_tier(value)
-    result = dict(dim[output_type][tier])
-    result["_dimension"] = dim_id
+    if tier_idx is None:
+        tier_idx = tier_index(value)
+    result = _tier_tables(output_type)[0][(dim_id, TIERS[tier_idx])].copy()
     result["_value"] = round(value, 3)
-    result["_tier"] = tier
 
     # Boundary proximity — useful for Layer 3 to modulate intensity
-    if value < 0.33:
-        result["_boundary_proximity"] = round(value / 0.33, 3)
-    elif value < 0.67:
-        result["_boundary_proximity"] = round((value - 0.33) / 0.34, 3)
-    else:
-        result["_boundary_proximity"] = round((value - 0.67) / 0.33, 3)
+    result["_boundary_proximity"] = round(
+        (value - _TIER_LO[tier_idx]) / _TIER_WIDTH[tier_idx], 3
+    )
 
     return result
 
 
+def _extract_vocabulary(coordinates: dict[str, float], output_type: str) -> dict:
+    """Bucketize all dimensions in one pass, then assemble their vocabularies."""
+    values = [coordinates[dim_id] for dim_id in PARAMETER_NAMES]
+    tiers = [tier_index(v) for v in values]
+    return {
+        dim_id: _interpolate_tier_vocabularies(dim_id, value, output_type, tier_idx)
+        for dim_id, value, tier_idx in zip(PARAMETER_NAMES, values, tiers)
+    }
+
+
 def _extract_text_vocabulary(coordinates: dict[str, float]) -> dict:
     """Extract complete text generation vocabulary from coordinates."""
-    result = {}
-    for dim_id in PARAMETER_NAMES:
-        result[dim_id] = _interpolate_tier_vocabularies(
-            dim_id, coordinates[dim_id], "text_output_mapping"
-        )
-    return result
+    return _extract_vocabulary(coordinates, "text_output_mapping")
 
 
 def _extract_image_vocabulary(coordinates: dict[str, float]) -> dict:
     """Extract complete image generation vocabulary from coordinates."""
-    result = {}
-    for dim_id in PARAMETER_NAMES:
-        result[dim_id] = _interpolate_tier_vocabularies(
-            dim_id, coordinates[dim_id], "image_output_mapping"
-        )
-    return result
+    return _extract_vocabulary(coordinates, "image_output_mapping")
+
+
+def _directive_parts(dim_vocab: dict, output_type: str) -> list[str]:
+    """Collect the *_directive strings of a per-dimension vocabulary."""
+    directives = _tier_tables(output_type)[1]
+    return [
+        directive
+        for dim_id in PARAMETER_NAMES
+        for directive in directives[(dim_id, dim_vocab[dim_id]["_tier"])]
+    ]
 
 
 # ---------------------------------------------------------------------------
 # Prompt generation
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
+def _author_vocabulary_items(
+    author_id: str,
+    output_type: str,
+) -> tuple[tuple[str, tuple], ...]:
+    """A catalog author's per-dimension vocabulary as immutable items."""
+    vocab = _extract_vocabulary(AUTHOR_CATALOG[author_id]["coordinates"], output_type)
+    return tuple((dim_id, tuple(v.items())) for dim_id, v in vocab.items())
+
+
+def _author_vocabulary(author_id: str, output_type: str) -> dict:
+    """Fresh per-dimension vocabulary dicts for a catalog author."""
+    return {
+        dim_id: dict(items)
+        for dim_id, items in _author_vocabulary_items(author_id, output_type)
+    }
+
+
+def _text_prompt_strings(
+    dim_directives: dict,
+    sig_moves: Sequence[str],
+    text_vocab: Mapping,
+) -> tuple[str, str, str]:
+    """Compose (master directive, moves text, vocabulary text) for a prompt."""
+    master_directive = " ".join(
+        _directive_parts(dim_directives, "text_output_mapping")
+    )
+
+    # Add signature moves if available
+    moves_text = ""
+    if sig_moves:
+        moves_text = "Key techniques: " + "; ".join(sig_moves[:5]) + "."
+
+    # Add author-specific vocabulary if available
+    vocab_text = ""
+    if text_vocab:
+        if "register" in text_vocab:
+            vocab_text += f"Register: {text_vocab['register']}. "
+        if "paragraph_rhythm" in text_vocab:
+            vocab_text += f"Paragraph rhythm: {text_vocab['paragraph_rhythm']}. "
+        if "forbidden" in text_vocab:
+            vocab_text += f"Avoid these words: {', '.join(text_vocab['forbidden'])}. "
+
+    return master_directive, moves_text, vocab_text
+
+
+@lru_cache(maxsize=None)
+def _author_text_strings(author_id: str) -> tuple[str, str, str]:
+    """_text_prompt_strings for a catalog author, composed once per author."""
+    entry = AUTHOR_CATALOG[author_id]
+    return _text_prompt_strings(
+        _author_vocabulary(author_id, "text_output_mapping"),
+        entry["signature_moves"],
+        entry["text_vocabulary"],
+    )
+
+
 def generate_text_prompt(
     author_id: Optional[str] = None,
     blend_spec: Optional[dict[str, float]] = None,
@@ -251,16 +452,12 @@ def generate_text_prompt(
     """
     if author_id:
         coords = get_coordinates(author_id)
-        entry = AUTHOR_CATALOG[author_id]
-        source_label = entry["display_name"]
-        text_vocab = entry["text_vocabulary"]
-        sig_moves = entry["signature_moves"]
+        source_label = AUTHOR_CATALOG[author_id]["display_name"]
     elif blend_spec:
-        result = interpolate_styles(blend_spec)
-        coords = result["coordinates"]
-        source_label = result["blend_display"]
+        _, ordered, coords = _blend_coords(blend_spec)
+        source_label = _blend_display(ordered)
         text_vocab = {}  # Blended — use dimension extraction
-        sig_moves = result["signature_moves"]
+        sig_moves = _blend_moves(ordered)
     elif custom_coordinates:
         coords = custom_coordinates
         source_label = "Custom coordinates"
@@ -269,38 +466,19 @@ def generate_text_prompt(
     else:
         raise ValueError("Provide author_id, blend_spec, or custom_coordinates")
 
-    # Extract per-dimension directives
-    dim_directives = _extract_text_vocabulary(coords)
-
-    # Compose master directive string
-    directive_parts = []
-    for dim_id in PARAMETER_NAMES:
-        tier_data = dim_directives[dim_id]
-        # Find the *_directive key
-        for k, v in tier_data.items():
-            if k.endswith("_directive") and isinstance(v, str):
-                directive_parts.append(v)
-
-    master_directive = " ".join(directive_parts)
-
-    # Add signature moves if available
-    moves_text = ""
-    if sig_moves:
-        moves_text = "Key techniques: " + "; ".join(sig_moves[:5]) + "."
-
-    # Add author-specific vocabulary if available
-    vocab_text = ""
-    if text_vocab:
-        if "register" in text_vocab:
-            vocab_text += f"Register: {text_vocab['register']}. "
-        if "paragraph_rhythm" in text_vocab:
-            vocab_text += f"Paragraph rhythm: {text_vocab['paragraph_rhythm']}. "
-        if "forbidden" in text_vocab:
-            vocab_text += f"Avoid these words: {', '.join(text_vocab['forbidden'])}. "
+    # Extract per-dimension directives and compose the prompt strings; a
+    # catalog author's are composed once and copied out on each call.
+    if author_id:
+        dim_directives = _author_vocabulary(author_id, "text_output_mapping")
+        strings = _author_text_strings(author_id)
+    else:
+        dim_directives = _extract_text_vocabulary(coords)
+        strings = _text_prompt_strings(dim_directives, sig_moves, text_vocab)
+    master_directive, moves_text, vocab_text = strings
 
     return {
         "source": source_label,
-        "coordinates": coords,
+        "coordinates": dict(coords),
         "master_directive": master_directive,
         "signature_moves": moves_text,
         "vocabulary_constraints": vocab_text,
@@ -309,6 +487,47 @@ def generate_text_prompt(
     }
 
 
+def _image_prompt_parts(
+    dim_visuals: dict,
+    img_vocab: Mapping,
+) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+    """
+    Compose (keywords, color palette, compositional rules, prompt parts)
+    for an image prompt; the prompt parts exclude any style modifier.
+    """
+    # Collect all visual directives
+    visual_directive_parts = _directive_parts(dim_visuals, "image_output_mapping")
+
+    # Compose keyword list from author vocabulary + dimension extraction
+    all_keywords = tuple(img_vocab.get("keywords", ()))
+
+    # Compose color palette
+    colors = tuple(img_vocab.get("color_palette", ()))
+
+    # Compose compositional rules
+    rules = tuple(img_vocab.get("compositional_rules", ()))
+
+    # Build the master prompt parts
+    prompt_parts = list(all_keywords[:8])
+    if colors:
+        prompt_parts.append(f"color palette: {', '.join(colors[:4])}")
+    prompt_parts.extend(visual_directive_parts[:6])
+
+    return all_keywords, colors, rules, tuple(prompt_parts)
+
+
+@lru_cache(maxsize=None)
+def _author_image_parts(
+    author_id: str,
+) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+    """_image_prompt_parts for a catalog author, composed once per author."""
+    entry = AUTHOR_CATALOG[author_id]
+    return _image_prompt_parts(
+        _author_vocabulary(author_id, "image_output_mapping"),
+        entry["image_vocabulary"],
+    )
+
+
 def generate_image_prompt(
     author_id: Optional[str] = None,
     blend_spec: Optional[dict[str, float]] = None,
@@ -325,14 +544,11 @@ def generate_image_prompt(
     """
     if author_id:
         coords = get_coordinates(author_id)
-        entry = AUTHOR_CATALOG[author_id]
-        source_label = entry["display_name"]
-        img_vocab = entry["image_vocabulary"]
+        source_label = AUTHOR_CATALOG[author_id]["display_name"]
     elif blend_spec:
-        result = interpolate_styles(blend_spec)
-        coords = result["coordinates"]
-        source_label = result["blend_display"]
-        img_vocab = result["image_vocabulary"]
+        _, ordered, coords = _blend_coords(blend_spec)
+        source_label = _blend_display(ordered)
+        img_vocab = {}  # Blended — use dimension extraction
     elif custom_coordinates:
         coords = custom_coordinates
         source_label = "Custom coordinates"
@@ -340,48 +556,82 @@ def generate_image_prompt(
     else:
         raise ValueError("Provide author_id, blend_spec, or custom_coordinates")
 
-    # Extract per-dimension visual directives
-    dim_visuals = _extract_image_vocabulary(coords)
-
-    # Collect all visual directives
-    visual_directive_parts = []
-    for dim_id in PARAMETER_NAMES:
-        tier_data = dim_visuals[dim_id]
-        for k, v in tier_data.items():
-            if k.endswith("_directive") and isinstance(v, str):
-                visual_directive_parts.append(v)
-
-    # Compose keyword list from author vocabulary + dimension extraction
-    all_keywords = list(img_vocab.get("keywords", []))
-
-    # Compose color palette
-    colors = img_vocab.get("color_palette", [])
-
-    # Compose compositional rules
-    rules = img_vocab.get("compositional_rules", [])
+    # Extract per-dimension visual directives and compose the prompt
+    # pieces; a catalog author's are composed once and copied out.
+    if author_id:
+        dim_visuals = _author_vocabulary(author_id, "image_output_mapping")
+        parts = _author_image_parts(author_id)
+    else:
+        dim_visuals = _extract_image_vocabulary(coords)
+        parts = _image_prompt_parts(dim_visuals, img_vocab)
+    all_keywords, colors, rules, prompt_parts = parts
 
-    # Build the master prompt
-    prompt_parts = []
     if style_modifier:
-        prompt_parts.append(style_modifier)
-    prompt_parts.extend(all_keywords[:8])
-    if colors:
-        prompt_parts.append(f"color palette: {', '.join(colors[:4])}")
-    prompt_parts.extend(visual_directive_parts[:6])
-
+        prompt_parts = (style_modifier,) + prompt_parts
     master_prompt = ", ".join(prompt_parts)
 
     return {
         "source": source_label,
-        "coordinates": coords,
+        "coordinates": dict(coords),
         "prompt": master_prompt,
-        "keywords": all_keywords,
-        "color_palette": colors,
-        "compositional_rules": rules,
+        "keywords": list(all_keywords),
+        "color_palette": list(colors),
+        "compositional_rules": list(rules),
         "per_dimension_visuals": dim_visuals,
     }
 
 
+# ---------------------------------------------------------------------------
+# Vocabulary constraints
+# ---------------------------------------------------------------------------
+
+def find_forbidden_words(author_id: str, text: str) -> list[str]:
+    """Return the author's forbidden words found in `text`, in order of use."""
+    return get_author(author_id).forbidden_re.findall(text)
+
+
+# Every author's avoid list folded into one alternation (longest first, so
+# phrases win over their prefixes), one named group per distinct word, plus
+# which authors forbid the word behind each group. Scoring a text against
+# the whole catalog is then one regex scan instead of one per author.
+_FORBIDDEN_BY_WORD: dict[str, tuple[str, ...]] = {}
+for _aid, _words in zip(AUTHOR_IDS, TEXT_VOCABULARY_COLUMNS["forbidden"]):
+    for _word in _words:
+        _authors = _FORBIDDEN_BY_WORD.get(_word.casefold(), ())
+        if _aid not in _authors:
+            _FORBIDDEN_BY_WORD[_word.casefold()] = _authors + (_aid,)
+del _aid, _words, _word, _authors
+
+_FORBIDDEN_WORDS_BY_LENGTH = sorted(_FORBIDDEN_BY_WORD, key=len, reverse=True)
+
+# Hits are attributed by group name, never by re-normalizing the matched
+# text: IGNORECASE accepts variants ("ſimply", "BEAUTİFUL") that no string
+# case mapping turns back into the catalog spelling.
+_FORBIDDEN_GROUP_AUTHORS: dict[str, tuple[str, ...]] = {
+    f"w{i}": _FORBIDDEN_BY_WORD[word]
+    for i, word in enumerate(_FORBIDDEN_WORDS_BY_LENGTH)
+}
+
+_ANY_FORBIDDEN_RE = re.compile(
+    r"\b(?:"
+    + "|".join(
+        f"(?P<w{i}>{re.escape(word)})"
+        for i, word in enumerate(_FORBIDDEN_WORDS_BY_LENGTH)
+    )
+    + r")\b",
+    re.IGNORECASE,
+)
+
+
+def count_forbidden_words(text: str) -> dict[str, int]:
+    """Count forbidden-word hits in `text` for every author, in catalog order."""
+    counts = dict.fromkeys(AUTHOR_IDS, 0)
+    for match in _ANY_FORBIDDEN_RE.finditer(text):
+        for aid in _FORBIDDEN_GROUP_AUTHORS[match.lastgroup]:
+            counts[aid] += 1
+    return counts
+
+
 # ---------------------------------------------------------------------------
 # Catalog queries
 # ---------------------------------------------------------------------------
@@ -392,50 +642,76 @@ def list_authors() -> dict:
         aid: {
             "display_name": entry["display_name"],
             "language_origin": entry["language_origin"],
-            "coordinates": entry["coordinates"],
+            "coordinates": dict(entry["coordinates"]),
         }
         for aid, entry in AUTHOR_CATALOG.items()
     }
 
 
+def _thaw(value):
+    """Plain dict / list copy of a frozen catalog value, for returned payloads."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
 def get_author_profile(author_id: str) -> dict:
     """Get complete profile for an author style brick."""
-    if author_id not in AUTHOR_CATALOG:
-        raise ValueError(
-            f"Unknown author '{author_id}'. "
-            f"Available: {list(AUTHOR_CATALOG.keys())}"
-        )
-    return dict(AUTHOR_CATALOG[author_id])
+    entry = AUTHOR_CATALOG.get(author_id)
+    if entry is None:
+        _unknown_author(author_id)
+    return _thaw(entry)
 
 
 def find_max_contrast_pair() -> dict:
     """Find the two authors with maximum distance in style-space."""
-    authors = list(AUTHOR_CATALOG.keys())
-    max_dist = 0.0
-    max_pair = (None, None)
+    # Rank pairs on the precomputed squared distances; only the winner
+    # gets the full per-dimension breakdown.
+    max_dist2 = -1.0
+    max_pair = (0, 0)
 
-    for i, a1 in enumerate(authors):
-        for a2 in authors[i + 1:]:
-            result = compute_style_distance(a1, a2)
-            if result["euclidean_distance"] > max_dist:
-                max_dist = result["euclidean_distance"]
-                max_pair = (a1, a2)
+    for i, dist2 in enumerate(AUTHOR_DIST2):
+        for j in range(i + 1, len(dist2)):
+            if dist2[j] > max_dist2:
+                max_dist2 = dist2[j]
+                max_pair = (i, j)
 
-    return compute_style_distance(max_pair[0], max_pair[1])
+    return compute_style_distance(AUTHOR_IDS[max_pair[0]], AUTHOR_IDS[max_pair[1]])
+
+
+def _neighbor_rows(idx: int) -> list[int]:
+    """Rows of every other author, closest to row `idx` first."""
+    dist2 = AUTHOR_DIST2[idx]
+    return sorted(
+        (j for j in range(len(dist2)) if j != idx), key=dist2.__getitem__
+    )
 
 
 def find_nearest_neighbor(author_id: str) -> dict:
     """Find the closest author in style-space to the given author."""
-    authors = list(AUTHOR_CATALOG.keys())
-    min_dist = float("inf")
-    nearest = None
-
-    for other in authors:
-        if other == author_id:
-            continue
-        result = compute_style_distance(author_id, other)
-        if result["euclidean_distance"] < min_dist:
-            min_dist = result["euclidean_distance"]
-            nearest = other
-
-    return compute_style_distance(author_id, nearest)
+    idx = _row_index(author_id)
+    nearest = _neighbor_rows(idx)[0]
+
+    return compute_style_distance(author_id, AUTHOR_IDS[nearest])
+
+
+def find_nearest_neighbors(author_id: str, k: int = 3) -> list[dict]:
+    """Find the k closest authors in style-space, closest first.
+
+    The author itself is excluded, so k runs from 1 to N - 1; compare
+    taxonomy.nearest_authors, which ranks the whole catalog (k up to N).
+    """
+    idx = _row_index(author_id)
+    if not 1 <= k < len(AUTHOR_IDS):
+        raise ValueError(f"k must be between 1 and {len(AUTHOR_IDS) - 1}")
+
+    return [
+        {
+            "id": AUTHOR_IDS[j],
+            "display_name": AUTHOR_CATALOG[AUTHOR_IDS[j]]["display_name"],
+            "distance": round(math.sqrt(AUTHOR_DIST2[idx][j]), 4),
+        }
+        for j in _neighbor_rows(idx)[:k]
+    ]
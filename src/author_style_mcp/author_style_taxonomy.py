@@ -23,10 +23,21 @@ Dimensions:
 All values normalized [0.0, 1.0].
 """
 
-from typing import TypedDict, Optional
+import heapq
+import math
+import re
+import sys
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import NamedTuple, NoReturn, TypedDict, Optional
 
 # ---------------------------------------------------------------------------
 # Type definitions
+#
+# Schemas for the literal tables below. Once frozen, entries are read-only
+# mappings and tuples, so container fields are typed as Mapping / Sequence.
 # ---------------------------------------------------------------------------
 
 class AuthorCoordinates(TypedDict):
@@ -41,6 +52,18 @@ class AuthorCoordinates(TypedDict):
     temporal_mode: float
 
 
+class StyleVector(NamedTuple):
+    """8D coordinate as a row; fields follow PARAMETER_NAMES order."""
+    syntactic_density: float
+    sensory_concreteness: float
+    ornamental_register: float
+    tension_visibility: float
+    tension_temporality: float
+    reality_stability: float
+    interiority: float
+    temporal_mode: float
+
+
 class DimensionSpec(TypedDict):
     """Specification for a single taxonomy dimension."""
     id: str
@@ -48,8 +71,8 @@ class DimensionSpec(TypedDict):
     description: str
     low_label: str
     high_label: str
-    text_output_mapping: dict
-    image_output_mapping: dict
+    text_output_mapping: Mapping
+    image_output_mapping: Mapping
 
 
 class AuthorEntry(TypedDict):
@@ -58,9 +81,9 @@ class AuthorEntry(TypedDict):
     display_name: str
     language_origin: str
     coordinates: AuthorCoordinates
-    signature_moves: list[str]
-    text_vocabulary: dict
-    image_vocabulary: dict
+    signature_moves: Sequence[str]
+    text_vocabulary: Mapping
+    image_vocabulary: Mapping
 
 
 # ---------------------------------------------------------------------------
@@ -902,25 +925,311 @@ PARAMETER_NAMES: list[str] = [
 ]
 
 
+# ---------------------------------------------------------------------------
+# Tiers — keys of every text_output_mapping / image_output_mapping
+# ---------------------------------------------------------------------------
+
+TIERS: tuple[str, ...] = ("low", "mid", "high")
+
+# Upper bounds of the low and mid tiers; values at an edge fall in the
+# higher tier.
+TIER_EDGES: tuple[float, ...] = (0.33, 0.67)
+
+
+def tier_index(value: float) -> int:
+    """Index into TIERS of the tier a 0-1 value falls in."""
+    return bisect_right(TIER_EDGES, value)
+
+
+def tiers_for(vec: Iterable[float]) -> list[str]:
+    """Tier name of each value in an 8D vector."""
+    return [TIERS[tier_index(v)] for v in vec]
+
+
+# ---------------------------------------------------------------------------
+# Freeze reference tables — read-only from here on
+# ---------------------------------------------------------------------------
+
+def _freeze(obj):
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType(
+            {sys.intern(k): _freeze(v) for k, v in obj.items()}
+        )
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    return obj
+
+
+DIMENSIONS: Mapping[str, DimensionSpec] = _freeze(DIMENSIONS)
+AUTHOR_CATALOG: Mapping[str, AuthorEntry] = _freeze(AUTHOR_CATALOG)
+
+
+# ---------------------------------------------------------------------------
+# Coordinate table — one row per author, aligned with PARAMETER_NAMES
+# ---------------------------------------------------------------------------
+
+AUTHOR_IDS: tuple[str, ...] = tuple(AUTHOR_CATALOG)
+AUTHOR_INDEX: Mapping[str, int] = MappingProxyType(
+    {aid: i for i, aid in enumerate(AUTHOR_IDS)}
+)
+
+# Rows reference the very float objects held by each author's coordinates
+# mapping, so the table adds no second copy of the values. StyleVector rows
+# also allow access by name (row.interiority) at tuple-index cost.
+AUTHOR_COORDS: tuple[StyleVector, ...] = tuple(
+    StyleVector._make(
+        AUTHOR_CATALOG[aid]["coordinates"][p] for p in PARAMETER_NAMES
+    )
+    for aid in AUTHOR_IDS
+)
+
+# Per-dimension catalog bounds and centroid, in PARAMETER_NAMES order.
+AUTHOR_COORDS_MIN: tuple[float, ...] = tuple(map(min, zip(*AUTHOR_COORDS)))
+AUTHOR_COORDS_MAX: tuple[float, ...] = tuple(map(max, zip(*AUTHOR_COORDS)))
+AUTHOR_COORDS_MEAN: tuple[float, ...] = tuple(
+    sum(column) / len(column) for column in zip(*AUTHOR_COORDS)
+)
+
+
+def coordinates_from_row(row: Iterable[float]) -> dict[str, float]:
+    """Name the values of an 8D row (PARAMETER_NAMES order) as coordinates."""
+    return dict(zip(PARAMETER_NAMES, row))
+
+
+# L2-normalized rows, so cosine similarity against the catalog is a plain
+# dot product per author with no per-query renormalization of the rows.
+AUTHOR_COORDS_UNIT: tuple[tuple[float, ...], ...] = tuple(
+    tuple(v / math.sqrt(sum(x * x for x in row)) for v in row)
+    for row in AUTHOR_COORDS
+)
+
+
+def squared_distances(vec: Sequence[float]) -> list[float]:
+    """Squared Euclidean distance from an 8D vector to each author row.
+
+    The single distance kernel for catalog scans; vec is in
+    PARAMETER_NAMES order and results are in AUTHOR_IDS order.
+    """
+    return [
+        sum((a - b) * (a - b) for a, b in zip(vec, row))
+        for row in AUTHOR_COORDS
+    ]
+
+
+# Squared distance between every pair of authors, AUTHOR_IDS order on both
+# axes, so catalog-to-catalog queries read a row instead of rescanning.
+AUTHOR_DIST2: tuple[tuple[float, ...], ...] = tuple(
+    tuple(squared_distances(row)) for row in AUTHOR_COORDS
+)
+
+
+def _as_row(vec: Sequence[float] | Mapping[str, float]) -> Sequence[float]:
+    """Accept coordinates either as a row or as a name -> value mapping."""
+    if isinstance(vec, Mapping):
+        return [vec[p] for p in PARAMETER_NAMES]
+    return vec
+
+
+def nearest_author(vec: Sequence[float] | Mapping[str, float]) -> str:
+    """Return the author nearest to an 8D vector.
+
+    vec is a row in PARAMETER_NAMES order or a coordinates mapping, e.g.
+    a point produced by aesthetics-dynamics-core.
+    """
+    dist2 = squared_distances(_as_row(vec))
+    return AUTHOR_IDS[min(range(len(dist2)), key=dist2.__getitem__)]
+
+
+def nearest_authors(
+    queries: Iterable[Sequence[float] | Mapping[str, float]],
+    k: int = 3,
+) -> list[list[str]]:
+    """Return the k nearest authors, closest first, for each 8D query vector.
+
+    Batch form of nearest_author — one call for many vectors, e.g. one per
+    generated paragraph. Every author is a candidate, so k runs from 1 to
+    N; operations.find_nearest_neighbors excludes the query author itself
+    and accepts 1 to N - 1.
+    """
+    if not 1 <= k <= len(AUTHOR_IDS):
+        raise ValueError(f"k must be between 1 and {len(AUTHOR_IDS)}")
+    results = []
+    for vec in queries:
+        dist2 = squared_distances(_as_row(vec))
+        results.append([
+            AUTHOR_IDS[i]
+            for i in heapq.nsmallest(k, range(len(dist2)), key=dist2.__getitem__)
+        ])
+    return results
+
+
+def cosine_to_authors(
+    vec: Sequence[float] | Mapping[str, float],
+) -> tuple[float, ...]:
+    """Cosine similarity of an 8D vector to each author, in AUTHOR_IDS order.
+
+    vec is a row in PARAMETER_NAMES order or a coordinates mapping.
+    """
+    vec = _as_row(vec)
+    norm = math.sqrt(sum(v * v for v in vec))
+    if norm == 0.0:
+        raise ValueError("Cosine similarity needs a non-zero vector")
+    unit = [v / norm for v in vec]
+    return tuple(
+        sum(a * b for a, b in zip(row, unit)) for row in AUTHOR_COORDS_UNIT
+    )
+
+
 # ---------------------------------------------------------------------------
 # Utility: extract coordinates only (for dynamics / distance computation)
 # ---------------------------------------------------------------------------
 
+# Shared tail of every unknown-author error, formatted once.
+_AVAILABLE_AUTHORS = f"Available: {list(AUTHOR_IDS)}"
+
+
+def _unknown_author(author_id: str) -> NoReturn:
+    """Raise the ValueError for an author ID missing from the catalog."""
+    raise ValueError(f"Unknown author '{author_id}'. {_AVAILABLE_AUTHORS}")
+
+
+# Plain per-author coordinate dicts, copied out by the getters below.
+_COORDINATE_DICTS: dict[str, dict[str, float]] = {
+    aid: dict(entry["coordinates"]) for aid, entry in AUTHOR_CATALOG.items()
+}
+
+
 def get_coordinates(author_id: str) -> AuthorCoordinates:
     """Return raw 8D coordinates for an author. Layer 1 lookup."""
-    if author_id not in AUTHOR_CATALOG:
-        raise ValueError(
-            f"Unknown author '{author_id}'. "
-            f"Available: {list(AUTHOR_CATALOG.keys())}"
-        )
-    return AUTHOR_CATALOG[author_id]["coordinates"]
+    coords = _COORDINATE_DICTS.get(author_id)
+    if coords is None:
+        _unknown_author(author_id)
+    return coords.copy()
+
+
+def get_coordinates_tuple(author_id: str) -> StyleVector:
+    """Return an author's 8D coordinates as a row in PARAMETER_NAMES order.
+
+    For dynamics callers that unpack into locals, e.g.
+    ``syn, sens, orn, vis, temp, real, inter, mode = get_coordinates_tuple(a)``.
+    """
+    idx = AUTHOR_INDEX.get(author_id)
+    if idx is None:
+        _unknown_author(author_id)
+    return AUTHOR_COORDS[idx]
 
 
 def get_all_coordinates() -> dict[str, AuthorCoordinates]:
     """Return coordinates for all authors. Layer 1 lookup."""
-    return {aid: entry["coordinates"] for aid, entry in AUTHOR_CATALOG.items()}
+    return {aid: coords.copy() for aid, coords in _COORDINATE_DICTS.items()}
 
 
 def get_author_ids() -> list[str]:
     """Return all available author IDs."""
-    return list(AUTHOR_CATALOG.keys())
+    return list(AUTHOR_IDS)
+
+
+# ---------------------------------------------------------------------------
+# Utility: author records (for prompt rendering and vocabulary filtering)
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True)
+class Author:
+    """One catalog entry as a record; coordinates are its AUTHOR_COORDS row."""
+    id: str
+    display_name: str
+    language_origin: str
+    coordinates: StyleVector
+    signature_moves: tuple[str, ...]
+    # Read-only mappings are unhashable, so the vocabularies stay out of
+    # __hash__ / __eq__; the record is identified by its other fields.
+    text_vocabulary: Mapping = field(hash=False, compare=False)
+    image_vocabulary: Mapping = field(hash=False, compare=False)
+    # text_vocabulary["forbidden"] as one case-insensitive alternation;
+    # is_forbidden and operations.find_forbidden_words both match through
+    # it, so a word and a scan of text containing it always agree.
+    forbidden_re: re.Pattern = field(compare=False)
+
+
+def _forbidden_pattern(words: Iterable[str]) -> re.Pattern:
+    """Compile an avoid list into one whole-word, case-insensitive pattern."""
+    return re.compile(
+        r"\b(?:" + "|".join(map(re.escape, words)) + r")\b", re.IGNORECASE
+    )
+
+
+# Aligned with AUTHOR_IDS / AUTHOR_COORDS.
+AUTHORS: tuple[Author, ...] = tuple(
+    Author(
+        id=aid,
+        display_name=AUTHOR_CATALOG[aid]["display_name"],
+        language_origin=AUTHOR_CATALOG[aid]["language_origin"],
+        coordinates=row,
+        signature_moves=AUTHOR_CATALOG[aid]["signature_moves"],
+        text_vocabulary=AUTHOR_CATALOG[aid]["text_vocabulary"],
+        image_vocabulary=AUTHOR_CATALOG[aid]["image_vocabulary"],
+        forbidden_re=_forbidden_pattern(
+            AUTHOR_CATALOG[aid]["text_vocabulary"]["forbidden"]
+        ),
+    )
+    for aid, row in zip(AUTHOR_IDS, AUTHOR_COORDS)
+)
+
+
+# Vocabulary fields pivoted to columns: field -> one value per author in
+# AUTHOR_IDS order, so reading a field across the catalog is one lookup.
+# Every author's vocabulary has the same keys; the per-author mappings stay
+# the primary, published form.
+TEXT_VOCABULARY_COLUMNS: Mapping[str, tuple] = MappingProxyType({
+    key: tuple(a.text_vocabulary[key] for a in AUTHORS)
+    for key in AUTHORS[0].text_vocabulary
+})
+IMAGE_VOCABULARY_COLUMNS: Mapping[str, tuple] = MappingProxyType({
+    key: tuple(a.image_vocabulary[key] for a in AUTHORS)
+    for key in AUTHORS[0].image_vocabulary
+})
+
+
+def get_author(author_id: str) -> Author:
+    """Return the record for an author. Layer 1 lookup."""
+    idx = AUTHOR_INDEX.get(author_id)
+    if idx is None:
+        _unknown_author(author_id)
+    return AUTHORS[idx]
+
+
+def is_forbidden(author_id: str, word: str) -> bool:
+    """Return True if `word` is on the author's avoid list (case-insensitive)."""
+    return get_author(author_id).forbidden_re.fullmatch(word) is not None
+
+
+# ---------------------------------------------------------------------------
+# Utility: tier vocabularies (for prompt rendering)
+# ---------------------------------------------------------------------------
+
+# Flat view of every tier vocabulary, keyed (dimension, modality, tier).
+# The values are the same frozen mappings DIMENSIONS holds, so the nested
+# form stays authoritative and this table adds only the keys.
+OUTPUT_MAPPINGS: Mapping[tuple[str, str, str], Mapping] = MappingProxyType({
+    (dim_id, modality, tier): spec[f"{modality}_output_mapping"][tier]
+    for dim_id, spec in DIMENSIONS.items()
+    for modality in ("text", "image")
+    for tier in TIERS
+})
+
+
+def get_output_mapping(dim_id: str, tier: str, modality: str = "text") -> Mapping:
+    """Return the tier vocabulary of a dimension for "text" or "image" output."""
+    mapping = OUTPUT_MAPPINGS.get((dim_id, modality, tier))
+    if mapping is not None:
+        return mapping
+    if dim_id not in DIMENSIONS:
+        raise ValueError(
+            f"Unknown dimension '{dim_id}'. Available: {PARAMETER_NAMES}"
+        )
+    if tier not in TIERS:
+        raise ValueError(f"Unknown tier '{tier}'. Available: {list(TIERS)}")
+    raise ValueError(f"Unknown modality '{modality}'. Use 'text' or 'image'")
@@ -0,0 +1,166 @@
+"""Tests for the MCP tool layer (tool functions are called directly)."""
+
+import json
+import math
+import sys
+import types
+
+import pytest
+
+import author_style_mcp
+from author_style_mcp import (
+    _dumps,
+    find_style_extremes,
+    generate_image_style_prompt,
+    generate_text_style_prompt,
+    get_author_style_profile,
+    get_author_styles,
+    get_parameter_names,
+    get_style_dimensions,
+)
+from author_style_operations import (
+    find_max_contrast_pair,
+    generate_image_prompt,
+    generate_text_prompt,
+    get_author_profile,
+    list_authors,
+)
+from author_style_taxonomy import AUTHOR_IDS, DIMENSIONS, PARAMETER_NAMES
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    """Run a test once with orjson (when installed) and once without."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(author_style_mcp, "orjson", None)
+    elif author_style_mcp.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+def test_dumps_matches_stdlib_json(encoder):
+    payload = generate_text_prompt(author_id="hemingway")
+    assert json.loads(_dumps(payload)) == json.loads(json.dumps(payload))
+    assert json.loads(_dumps(PARAMETER_NAMES, indent=False)) == PARAMETER_NAMES
+
+
+def test_dumps_falls_back_for_integers_beyond_64_bits(encoder):
+    assert json.loads(_dumps({"n": 2 ** 70})) == {"n": 2 ** 70}
+
+
+def test_custom_coordinates_with_big_integers(encoder):
+    coords = dict.fromkeys(PARAMETER_NAMES, 0.5)
+    coords["interiority"] = 2 ** 70
+    result = json.loads(
+        generate_text_style_prompt(custom_coordinates_json=json.dumps(coords))
+    )
+    assert result["coordinates"]["interiority"] == 2 ** 70
+
+
+def test_custom_coordinates_keep_non_finite_values(encoder):
+    coords = dict.fromkeys(PARAMETER_NAMES, 0.5)
+    coords["interiority"] = math.inf
+    result = json.loads(
+        generate_text_style_prompt(custom_coordinates_json=json.dumps(coords))
+    )
+    assert result["coordinates"]["interiority"] == math.inf
+
+
+# ---------------------------------------------------------------------------
+# Layer 1 tools — pre-encoded payloads
+# ---------------------------------------------------------------------------
+
+def _thawed(value):
+    """Round-trip a (possibly frozen) value through stdlib json."""
+    return json.loads(json.dumps(value, default=dict))
+
+
+def test_layer1_tools_match_their_sources():
+    assert json.loads(get_author_styles()) == json.loads(json.dumps(list_authors()))
+    assert json.loads(get_style_dimensions()) == _thawed(DIMENSIONS)
+    assert json.loads(get_parameter_names()) == PARAMETER_NAMES
+
+
+# ---------------------------------------------------------------------------
+# Catalog-determined Layer 2 tools — memoized encodings
+# ---------------------------------------------------------------------------
+
+def _round_trip(value):
+    return json.loads(json.dumps(value))
+
+
+@pytest.mark.parametrize("author_id", AUTHOR_IDS)
+def test_memoized_author_tools_match_operations(author_id):
+    assert json.loads(get_author_style_profile(author_id)) == _round_trip(
+        get_author_profile(author_id)
+    )
+    assert json.loads(generate_text_style_prompt(author_id=author_id)) == _round_trip(
+        generate_text_prompt(author_id=author_id)
+    )
+    assert json.loads(generate_image_style_prompt(author_id=author_id)) == _round_trip(
+        generate_image_prompt(author_id=author_id)
+    )
+    assert json.loads(
+        generate_image_style_prompt(author_id=author_id, style_modifier="ink")
+    ) == _round_trip(generate_image_prompt(author_id=author_id, style_modifier="ink"))
+
+
+def test_find_style_extremes_matches_operation():
+    assert json.loads(find_style_extremes()) == _round_trip(find_max_contrast_pair())
+
+
+def test_memoized_tools_reject_unknown_authors():
+    for tool in (get_author_style_profile, generate_text_style_prompt):
+        with pytest.raises(ValueError, match="Unknown author"):
+            tool("nobody")
+    with pytest.raises(ValueError, match="Unknown author"):
+        generate_image_style_prompt(author_id="nobody")
+
+
+# ---------------------------------------------------------------------------
+# Server construction (fastmcp stubbed out)
+# ---------------------------------------------------------------------------
+
+class _StubFastMCP:
+    def __init__(self, name):
+        self.name = name
+        self.tools = []
+
+    def tool(self):
+        def register(fn):
+            self.tools.append(fn)
+            return fn
+        return register
+
+
+@pytest.fixture
+def stub_fastmcp(monkeypatch):
+    module = types.ModuleType("fastmcp")
+    module.FastMCP = _StubFastMCP
+    monkeypatch.setitem(sys.modules, "fastmcp", module)
+    monkeypatch.delitem(author_style_mcp.__dict__, "mcp", raising=False)
+    yield
+    author_style_mcp.__dict__.pop("mcp", None)
+
+
+def test_build_server_registers_every_tool(stub_fastmcp):
+    server = author_style_mcp.build_server()
+    assert server.name == "author-style-esque"
+    assert server.tools == list(author_style_mcp._TOOLS)
+    assert len(server.tools) == 11
+
+
+def test_mcp_is_built_lazily_once(stub_fastmcp):
+    assert "mcp" not in author_style_mcp.__dict__
+    server = author_style_mcp.mcp
+    assert isinstance(server, _StubFastMCP)
+    assert author_style_mcp.mcp is server
+
+
+def test_unknown_module_attribute_raises():
+    with pytest.raises(AttributeError):
+        author_style_mcp.not_a_server
@@ -0,0 +1,176 @@
+"""Tests for Layer 2 operations."""
+
+import json
+
+import pytest
+
+from author_style_operations import (
+    compute_style_distance,
+    count_forbidden_words,
+    find_forbidden_words,
+    find_nearest_neighbor,
+    find_nearest_neighbors,
+    generate_image_prompt,
+    generate_text_prompt,
+    get_author_profile,
+    interpolate_styles,
+    list_authors,
+)
+from author_style_taxonomy import AUTHOR_IDS, get_coordinates
+
+
+# ---------------------------------------------------------------------------
+# Distance and interpolation
+# ---------------------------------------------------------------------------
+
+def test_compute_style_distance_results_are_not_shared():
+    first = compute_style_distance("kafka", "hemingway")
+    first["per_dimension"]["interiority"]["absolute_gap"] = -1.0
+    first["euclidean_distance"] = -1.0
+    second = compute_style_distance("kafka", "hemingway")
+    assert second["euclidean_distance"] == 1.07
+    assert second["per_dimension"]["interiority"]["absolute_gap"] == 0.2
+
+
+def test_interpolate_styles_results_are_not_shared():
+    blend = {"kafka": 0.5, "hemingway": 0.5}
+    first = interpolate_styles(blend)
+    first["coordinates"]["interiority"] = -1.0
+    first["signature_moves"].clear()
+    second = interpolate_styles(blend)
+    assert second["coordinates"]["interiority"] >= 0.0
+    assert second["signature_moves"]
+
+
+@pytest.mark.parametrize("blend, nearest", [
+    ({"de_sade": 0.5, "lovecraft": 0.5}, "lovecraft"),
+    # Squared distances differ by an ulp but share a sqrt: first in catalog wins.
+    ({"hemingway": 0.5, "didion": 0.5}, "hemingway"),
+])
+def test_interpolate_styles_nearest_author(blend, nearest):
+    assert interpolate_styles(blend)["nearest_catalog_author"]["id"] == nearest
+
+
+# ---------------------------------------------------------------------------
+# Neighbors
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("author_id", AUTHOR_IDS)
+def test_find_nearest_neighbors_excludes_self_and_is_sorted(author_id):
+    neighbors = find_nearest_neighbors(author_id, k=len(AUTHOR_IDS) - 1)
+    ids = [n["id"] for n in neighbors]
+    assert author_id not in ids
+    assert sorted(ids) == sorted(set(AUTHOR_IDS) - {author_id})
+    dists = [n["distance"] for n in neighbors]
+    assert dists == sorted(dists)
+
+
+@pytest.mark.parametrize("author_id", AUTHOR_IDS)
+def test_find_nearest_neighbors_first_matches_find_nearest_neighbor(author_id):
+    first = find_nearest_neighbors(author_id, k=1)[0]
+    assert first["display_name"] == find_nearest_neighbor(author_id)["author_2"]
+
+
+@pytest.mark.parametrize("k", [0, len(AUTHOR_IDS)])
+def test_find_nearest_neighbors_rejects_k_out_of_range(k):
+    with pytest.raises(ValueError, match="k must be between"):
+        find_nearest_neighbors("kafka", k=k)
+
+
+# ---------------------------------------------------------------------------
+# Prompt generation
+# ---------------------------------------------------------------------------
+
+PROMPT_SOURCES = [
+    {"author_id": "kafka"},
+    {"blend_spec": {"kafka": 0.5, "hemingway": 0.5}},
+    {"custom_coordinates": get_coordinates("kafka")},
+]
+
+
+def test_payloads_are_json_serializable():
+    json.dumps(list_authors())
+    json.dumps(get_author_profile("kafka"))
+    json.dumps(interpolate_styles({"kafka": 0.5, "hemingway": 0.5}))
+    for source in PROMPT_SOURCES:
+        json.dumps(generate_text_prompt(**source))
+        json.dumps(generate_image_prompt(**source))
+
+
+@pytest.mark.parametrize("source", PROMPT_SOURCES, ids=lambda s: next(iter(s)))
+def test_prompt_coordinates_are_dicts_on_every_path(source):
+    assert type(generate_text_prompt(**source)["coordinates"]) is dict
+    assert type(generate_image_prompt(**source)["coordinates"]) is dict
+
+
+@pytest.mark.parametrize("author_id", AUTHOR_IDS)
+def test_author_prompts_match_extraction_from_coordinates(author_id):
+    by_author = generate_text_prompt(author_id=author_id)
+    by_coords = generate_text_prompt(custom_coordinates=get_coordinates(author_id))
+    assert by_author["master_directive"] == by_coords["master_directive"]
+    assert by_author["per_dimension_directives"] == by_coords["per_dimension_directives"]
+
+    by_author = generate_image_prompt(author_id=author_id)
+    by_coords = generate_image_prompt(custom_coordinates=get_coordinates(author_id))
+    assert by_author["per_dimension_visuals"] == by_coords["per_dimension_visuals"]
+
+
+def test_prompt_results_are_not_shared():
+    first = generate_text_prompt(author_id="kafka")
+    first["coordinates"]["interiority"] = -1.0
+    first["per_dimension_directives"].clear()
+    second = generate_text_prompt(author_id="kafka")
+    assert second["coordinates"] == get_coordinates("kafka")
+    assert second["per_dimension_directives"]
+
+    first = generate_image_prompt(author_id="kafka")
+    first["keywords"].clear()
+    next(iter(first["per_dimension_visuals"].values())).clear()
+    second = generate_image_prompt(author_id="kafka")
+    assert second["keywords"]
+    assert all(second["per_dimension_visuals"].values())
+
+
+def test_image_prompt_style_modifier_leads_the_prompt():
+    plain = generate_image_prompt(author_id="kafka")["prompt"]
+    styled = generate_image_prompt(author_id="kafka", style_modifier="oil painting")
+    assert styled["prompt"] == f"oil painting, {plain}"
+
+
+# ---------------------------------------------------------------------------
+# Forbidden words
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("operation", [
+    lambda aid: find_forbidden_words(aid, "simply"),
+    get_author_profile,
+    find_nearest_neighbor,
+    lambda aid: compute_style_distance(aid, "kafka"),
+])
+def test_unknown_author_errors_list_the_catalog(operation):
+    with pytest.raises(ValueError, match="Unknown author 'nobody'. Available: .*hemingway"):
+        operation("nobody")
+
+
+def test_count_forbidden_words_folds_case_like_the_regex():
+    counts = count_forbidden_words("ſimply")
+    assert counts["lispector"] == 1
+    assert sum(counts.values()) == 1
+
+
+def test_count_forbidden_words_accepts_dotted_and_dotless_i():
+    assert count_forbidden_words("A BEAUTİFUL day")["hemingway"] == 1
+    assert count_forbidden_words("sımply")["lispector"] == 1
+
+
+def test_count_forbidden_words_matches_phrases():
+    counts = count_forbidden_words("In conclusion, the garden was quiet.")
+    assert counts["shonagon"] == 1
+
+
+def test_count_forbidden_words_agrees_with_per_author_scan():
+    text = "Of course it was an awe-inspiring, magnificent thing. In conclusion."
+    counts = count_forbidden_words(text)
+    assert list(counts) == list(AUTHOR_IDS)
+    for aid in AUTHOR_IDS:
+        assert counts[aid] == len(find_forbidden_words(aid, text))
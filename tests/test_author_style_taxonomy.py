@@ -0,0 +1,195 @@
+"""Tests for Layer 1 taxonomy helpers."""
+
+import json
+import math
+
+import pytest
+
+from author_style_taxonomy import (
+    AUTHOR_CATALOG,
+    AUTHOR_COORDS,
+    AUTHOR_COORDS_MAX,
+    AUTHOR_COORDS_MEAN,
+    AUTHOR_COORDS_MIN,
+    AUTHOR_DIST2,
+    AUTHOR_IDS,
+    AUTHORS,
+    DIMENSIONS,
+    IMAGE_VOCABULARY_COLUMNS,
+    PARAMETER_NAMES,
+    TEXT_VOCABULARY_COLUMNS,
+    cosine_to_authors,
+    get_all_coordinates,
+    get_author,
+    get_coordinates,
+    get_coordinates_tuple,
+    get_output_mapping,
+    is_forbidden,
+    nearest_author,
+    nearest_authors,
+    tiers_for,
+)
+
+
+# ---------------------------------------------------------------------------
+# Coordinate lookups
+# ---------------------------------------------------------------------------
+
+def test_get_coordinates_returns_a_fresh_plain_dict():
+    coords = get_coordinates("hemingway")
+    assert type(coords) is dict
+    assert coords == dict(AUTHOR_CATALOG["hemingway"]["coordinates"])
+    json.dumps(coords)
+
+    coords["interiority"] = 99
+    assert get_coordinates("hemingway")["interiority"] != 99
+
+
+def test_coordinate_rows_follow_parameter_names():
+    for aid, row in zip(AUTHOR_IDS, AUTHOR_COORDS):
+        assert row._fields == tuple(PARAMETER_NAMES)
+        assert row._asdict() == get_coordinates(aid)
+        assert get_coordinates_tuple(aid) is row
+    coords = get_coordinates("kafka")
+    syn, *_, mode = get_coordinates_tuple("kafka")
+    assert (syn, mode) == (coords["syntactic_density"], coords["temporal_mode"])
+
+
+def test_get_all_coordinates_returns_fresh_plain_dicts():
+    everything = get_all_coordinates()
+    assert list(everything) == list(AUTHOR_IDS)
+    assert all(type(coords) is dict for coords in everything.values())
+    json.dumps(everything)
+
+    everything["kafka"]["interiority"] = 99
+    assert get_all_coordinates()["kafka"] == get_coordinates("kafka")
+
+
+@pytest.mark.parametrize("lookup", [get_coordinates, get_coordinates_tuple, get_author])
+def test_unknown_author_errors_list_the_catalog(lookup):
+    with pytest.raises(ValueError, match="Unknown author 'nobody'. Available: .*hemingway"):
+        lookup("nobody")
+
+
+# ---------------------------------------------------------------------------
+# Catalog queries
+# ---------------------------------------------------------------------------
+
+def test_author_dist2_matches_direct_distances():
+    for i, row_i in enumerate(AUTHOR_COORDS):
+        assert AUTHOR_DIST2[i][i] == 0.0
+        for j, row_j in enumerate(AUTHOR_COORDS):
+            assert AUTHOR_DIST2[i][j] == AUTHOR_DIST2[j][i]
+            assert math.sqrt(AUTHOR_DIST2[i][j]) == pytest.approx(
+                math.dist(row_i, row_j)
+            )
+
+
+def test_nearest_author_accepts_row_or_mapping():
+    for aid in AUTHOR_IDS:
+        coords = get_coordinates(aid)
+        assert nearest_author(coords) == aid
+        assert nearest_author(list(coords.values())) == aid
+
+
+def test_nearest_authors_ranks_whole_catalog():
+    queries = [get_coordinates(aid) for aid in AUTHOR_IDS]
+    ranked = nearest_authors(queries, k=len(AUTHOR_IDS))
+    for aid, row in zip(AUTHOR_IDS, ranked):
+        assert row[0] == aid
+        assert sorted(row) == sorted(AUTHOR_IDS)
+    assert nearest_authors(queries, k=1) == [[aid] for aid in AUTHOR_IDS]
+
+
+@pytest.mark.parametrize("k", [0, len(AUTHOR_IDS) + 1])
+def test_nearest_authors_rejects_k_out_of_range(k):
+    with pytest.raises(ValueError, match="k must be between"):
+        nearest_authors([get_coordinates("kafka")], k=k)
+
+
+def test_cosine_to_authors_accepts_row_or_mapping():
+    coords = get_coordinates("kafka")
+    by_mapping = cosine_to_authors(coords)
+    by_row = cosine_to_authors(list(coords.values()))
+    assert by_mapping == by_row
+    assert len(by_row) == len(AUTHOR_IDS)
+    assert by_row[AUTHOR_IDS.index("kafka")] == pytest.approx(1.0)
+    assert max(by_row) == by_row[AUTHOR_IDS.index("kafka")]
+
+
+def test_cosine_to_authors_rejects_zero_vector():
+    with pytest.raises(ValueError, match="non-zero"):
+        cosine_to_authors([0.0] * 8)
+
+
+# ---------------------------------------------------------------------------
+# Tiers and bounds
+# ---------------------------------------------------------------------------
+
+def test_tiers_for_edges_fall_in_higher_tier():
+    assert tiers_for([0.0, 0.32, 0.33, 0.66, 0.67, 1.0]) == [
+        "low", "low", "mid", "mid", "high", "high",
+    ]
+
+
+def test_get_output_mapping_reads_the_nested_tables():
+    spec = DIMENSIONS["interiority"]
+    assert get_output_mapping("interiority", "low") is spec["text_output_mapping"]["low"]
+    assert (
+        get_output_mapping("interiority", "high", "image")
+        is spec["image_output_mapping"]["high"]
+    )
+
+
+@pytest.mark.parametrize("args, message", [
+    (("nope", "low"), "Unknown dimension"),
+    (("interiority", "extreme"), "Unknown tier"),
+    (("interiority", "low", "audio"), "Unknown modality"),
+])
+def test_get_output_mapping_validates_arguments(args, message):
+    with pytest.raises(ValueError, match=message):
+        get_output_mapping(*args)
+
+
+def test_coordinate_bounds_cover_every_author():
+    for row in AUTHOR_COORDS:
+        for lo, value, hi in zip(AUTHOR_COORDS_MIN, row, AUTHOR_COORDS_MAX):
+            assert lo <= value <= hi
+    for lo, mean, hi in zip(AUTHOR_COORDS_MIN, AUTHOR_COORDS_MEAN, AUTHOR_COORDS_MAX):
+        assert lo <= mean <= hi
+
+
+# ---------------------------------------------------------------------------
+# Author records
+# ---------------------------------------------------------------------------
+
+def test_author_records_are_hashable():
+    assert len(set(AUTHORS)) == len(AUTHOR_IDS)
+    assert {get_author("kafka"): 1}[get_author("kafka")] == 1
+    assert get_author("kafka").coordinates == tuple(get_coordinates("kafka").values())
+
+
+def test_vocabulary_columns_align_with_author_ids():
+    for columns, field in (
+        (TEXT_VOCABULARY_COLUMNS, "text_vocabulary"),
+        (IMAGE_VOCABULARY_COLUMNS, "image_vocabulary"),
+    ):
+        for key, column in columns.items():
+            assert len(column) == len(AUTHOR_IDS)
+            for aid, value in zip(AUTHOR_IDS, column):
+                assert value is AUTHOR_CATALOG[aid][field][key]
+
+
+def test_is_forbidden_folds_case():
+    assert is_forbidden("lispector", "SIMPLY")
+    assert is_forbidden("lispector", "ſimply")
+    assert is_forbidden("hemingway", "BEAUTİFUL")
+    assert not is_forbidden("lispector", "garden")
+    assert not is_forbidden("lispector", "simply ")
+
+
+def test_is_forbidden_agrees_with_the_avoid_list():
+    for author in AUTHORS:
+        for word in author.text_vocabulary["forbidden"]:
+            for variant in (word, word.upper(), word.title()):
+                assert is_forbidden(author.id, variant)